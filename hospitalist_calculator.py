@@ -47,8 +47,95 @@ NIGHT_STANDARD_THRESHOLD = 21
 NIGHT_STANDARD_SOS = 1.5
 NIGHT_PREMIUM_SOS = 1.75
 
+# Day-shift (type, ratio, sos) in breakdown display order (Direct Care last,
+# since it fills whatever FTE the other shifts leave)
+_DAY_SHIFT_RATES = tuple(
+    (k, SHIFT_TYPES[k]["ratio"], SHIFT_TYPES[k]["sos"])
+    for k in ("Teaching", "Women & Families Days", "Episcopal", "Clinic", "Direct Care Days")
+)
+
+# Shift-equivalent ratios used to size Direct Care Days (nights count 1:1)
+_RATIO_TEACHING = SHIFT_TYPES["Teaching"]["ratio"]
+_RATIO_WOMEN_FAMILIES = SHIFT_TYPES["Women & Families Days"]["ratio"]
+_RATIO_EPISCOPAL = SHIFT_TYPES["Episcopal"]["ratio"]
+_RATIO_CLINIC = SHIFT_TYPES["Clinic"]["ratio"]
+
+# Dropdown options: label -> calendar days (teaching weeks are 7 days, clinic weeks 5)
+_TEACHING_OPTIONS = {f"{w} week{'s' if w != 1 else ''} ({w * 7} days)": w * 7 for w in range(17)}
+_CLINIC_OPTIONS = {f"{w} week{'s' if w != 1 else ''} ({w * 5} days)": w * 5 for w in range(53)}
+_TEACHING_LABELS = tuple(_TEACHING_OPTIONS)
+_CLINIC_LABELS = tuple(_CLINIC_OPTIONS)
+
+_SHIFT_REFERENCE = """
+Shift Type                  Shift Eq   SoS Value   Notes
+--------------------------  --------   ---------   ------------------
+Teaching                    1.0        1.0
+Direct Care Days            1.0        1.25        Standard day shifts
+Women & Families            1.2        1.25
+Standard Nights (first 21)  1.0        1.5         Night premium
+Premium Nights (after 21)   1.0        1.75        Extra night premium
+Episcopal                   0.75       1.05
+Clinic                      0.9        1.125       Outpatient
+Addiction                   1.0        --          Separate compensation
+
+1.0 FTE = 183 shift equivalents/year
+Addiction/Other Dept: $240,000 per FTE
+Addiction Board Bonus: $20,000
+"""
+
+_CSS = """
+<style>
+    .stButton > button[kind="primary"],
+    .stFormSubmitButton > button[kind="primaryFormSubmit"] {
+        background-color: #9D2235;
+        border-color: #9D2235;
+    }
+    .stButton > button[kind="primary"]:hover,
+    .stFormSubmitButton > button[kind="primaryFormSubmit"]:hover {
+        background-color: #7A1A2A;
+        border-color: #7A1A2A;
+    }
+    .big-number {
+        font-size: 4rem;
+        font-weight: 700;
+        color: #28a745;
+        line-height: 1.2;
+        margin: 0.5rem 0;
+    }
+    .row-label {
+        padding-top: 8px;
+        font-weight: 500;
+        text-align: right;
+    }
+    [data-testid="stNumberInput"] {
+        max-width: 120px;
+    }
+    [data-baseweb="select"] {
+        max-width: 100%;
+    }
+    [data-testid="stDateInput"] {
+        max-width: 150px;
+    }
+    [data-testid="stSlider"] {
+        padding-top: 8px;
+    }
+    .stNumberInput button:focus {
+        outline: none !important;
+        box-shadow: none !important;
+    }
+    .stNumberInput button:focus-visible {
+        outline: none !important;
+        box-shadow: none !important;
+    }
+    [data-baseweb="input"]:focus-within {
+        border-color: #ccc !important;
+        box-shadow: none !important;
+    }
+</style>
+"""
+
 
-@dataclass
+@dataclass(slots=True)
 class CalculationResult:
     """Holds all calculated compensation values"""
     time_fraction: float
@@ -74,6 +161,68 @@ class CalculationResult:
     total_compensation: float
 
 
+@dataclass(slots=True)
+class ShiftPlan:
+    """FTE split and auto-filled Direct Care Days for a given shift mix"""
+    time_fraction: float
+    addiction_fte: float
+    actual_hm_fte: float
+    clinical_fte: float
+    target_shift_eq: int
+    other_shifts: float
+    direct_care_days: int
+
+
+def _time_fraction(start_date: date, leave_days: int) -> float:
+    """Fraction of the fiscal year worked, after late start and leave."""
+    if start_date <= FISCAL_YEAR_START:
+        days_in_fy = TOTAL_FY_DAYS
+    elif start_date > FISCAL_YEAR_END:
+        days_in_fy = 0
+    else:
+        days_in_fy = (FISCAL_YEAR_END - start_date).days + 1
+    effective_days = max(0, days_in_fy - leave_days)
+    return effective_days / TOTAL_FY_DAYS
+
+
+def _derive_shift_plan(
+    time_fraction: float,
+    status_fte: float,
+    non_clinical_fte: float,
+    other_dept_fte: float,
+    shift_days: dict,
+) -> ShiftPlan:
+    """Size the hospitalist shift target and fill the remainder with Direct Care Days."""
+    # Calculate Addiction FTE from shifts
+    addiction_fte = shift_days.get("Addiction", 0) / BASE_SHIFT_EQUIVALENTS
+
+    # Actual HM FTE (for shifts) = Status - NonClinical - Other - Addiction
+    actual_hm_fte = max(0, status_fte - non_clinical_fte - other_dept_fte - addiction_fte)
+    clinical_fte = actual_hm_fte * time_fraction
+    # Round shift equivalents to integer using Excel-style round-half-up
+    # (Python's round() uses banker's rounding which rounds 0.5 to even)
+    target_shift_eq = int(clinical_fte * BASE_SHIFT_EQUIVALENTS + 0.5)
+
+    other_shifts = (
+        shift_days.get("Teaching", 0) * _RATIO_TEACHING +
+        shift_days.get("Women & Families Days", 0) * _RATIO_WOMEN_FAMILIES +
+        shift_days.get("Nights", 0) +
+        shift_days.get("Episcopal", 0) * _RATIO_EPISCOPAL +
+        shift_days.get("Clinic", 0) * _RATIO_CLINIC
+    )
+    direct_care_days = max(0, int(target_shift_eq - other_shifts))
+
+    return ShiftPlan(
+        time_fraction=time_fraction,
+        addiction_fte=addiction_fte,
+        actual_hm_fte=actual_hm_fte,
+        clinical_fte=clinical_fte,
+        target_shift_eq=target_shift_eq,
+        other_shifts=other_shifts,
+        direct_care_days=direct_care_days,
+    )
+
+
 def calculate_compensation(
     start_date: date,
     leave_days: int,
@@ -87,52 +236,43 @@ def calculate_compensation(
     other_stipend: float,
 ) -> CalculationResult:
     """Calculate hospitalist compensation based on A+B model."""
+    shift_plan = _derive_shift_plan(
+        _time_fraction(start_date, leave_days),
+        status_fte,
+        non_clinical_fte,
+        other_dept_fte,
+        shift_days,
+    )
 
-    # Time fraction
-    if start_date <= FISCAL_YEAR_START:
-        days_in_fy = TOTAL_FY_DAYS
-    elif start_date > FISCAL_YEAR_END:
-        days_in_fy = 0
-    else:
-        days_in_fy = (FISCAL_YEAR_END - start_date).days + 1
-    effective_days = max(0, days_in_fy - leave_days)
-    time_fraction = effective_days / TOTAL_FY_DAYS
-
-    # Calculate Addiction FTE from shifts
-    addiction_shifts = shift_days.get("Addiction", 0)
-    addiction_fte = addiction_shifts / BASE_SHIFT_EQUIVALENTS
+    time_fraction = shift_plan.time_fraction
+    addiction_fte = shift_plan.addiction_fte
 
     # HM FTE (for B calc) = Status - Other - Addiction (NOT non-clinical)
     hm_fte = max(0, status_fte - other_dept_fte - addiction_fte)
 
-    # Actual HM FTE (for shifts) = Status - NonClinical - Other - Addiction
-    actual_hm_fte = max(0, status_fte - non_clinical_fte - other_dept_fte - addiction_fte)
-    hospitalist_fte = actual_hm_fte
-    clinical_fte = actual_hm_fte * time_fraction
-    # Round shift equivalents to integer using Excel-style round-half-up
-    # (Python's round() uses banker's rounding which rounds 0.5 to even)
-    shift_equivalents = int(clinical_fte * BASE_SHIFT_EQUIVALENTS + 0.5)
+    hospitalist_fte = shift_plan.actual_hm_fte
+    clinical_fte = shift_plan.clinical_fte
+    shift_equivalents = shift_plan.target_shift_eq
 
     # Calculate shift breakdown and SoS
     shift_breakdown = {}
     total_sos_value = 0
     total_shift_eq = 0
 
-    for shift_type, days in shift_days.items():
-        if shift_type == "Nights" or shift_type == "Addiction":
+    for shift_type, ratio, sos in _DAY_SHIFT_RATES:
+        if shift_type not in shift_days:
             continue
 
-        if shift_type in SHIFT_TYPES:
-            config = SHIFT_TYPES[shift_type]
-            shift_eq = days * config["ratio"]
-            sos_value = shift_eq * config["sos"]
-            shift_breakdown[shift_type] = {
-                "days": days,
-                "shift_eq": shift_eq,
-                "sos_value": sos_value,
-            }
-            total_sos_value += sos_value
-            total_shift_eq += shift_eq
+        days = shift_days[shift_type]
+        shift_eq = days * ratio
+        sos_value = shift_eq * sos
+        shift_breakdown[shift_type] = {
+            "days": days,
+            "shift_eq": shift_eq,
+            "sos_value": sos_value,
+        }
+        total_sos_value += sos_value
+        total_shift_eq += shift_eq
 
     # Process nights (tiered)
     night_days = shift_days.get("Nights", 0)
@@ -218,60 +358,32 @@ def calculate_compensation(
 # STREAMLIT UI
 # =============================================================================
 
+_ROW_RATIO = (0.3, 1.2, 1, 0.3)
+_LABEL_HTML = {
+    name: f'<p class="row-label">{name}</p>'
+    for name in (
+        "", "Start Date", "Leave Days", "Status FTE", "Non-Clinical FTE", "Other Dept FTE",
+        "Academic Rank", "Graduation Year", "Addiction Board Certified", "Other Stipend ($)",
+        "Teaching", "Direct Care Days", "Women & Families", "Nights", "Episcopal", "Clinic",
+        "Addiction Medicine",
+    )
+}
+
+
+def labeled_row(label: str):
+    """Render a right-aligned label and return the column for its widget."""
+    _, c1, c2, _ = st.columns(_ROW_RATIO)
+    c1.markdown(_LABEL_HTML.get(label) or f'<p class="row-label">{label}</p>', unsafe_allow_html=True)
+    return c2
+
+
 st.set_page_config(
     page_title="Hospitalist Compensation Calculator",
     page_icon=":hospital:",
     layout="wide"
 )
 
-st.markdown("""
-<style>
-    .stButton > button[kind="primary"] {
-        background-color: #9D2235;
-        border-color: #9D2235;
-    }
-    .stButton > button[kind="primary"]:hover {
-        background-color: #7A1A2A;
-        border-color: #7A1A2A;
-    }
-    .big-number {
-        font-size: 4rem;
-        font-weight: 700;
-        color: #28a745;
-        line-height: 1.2;
-        margin: 0.5rem 0;
-    }
-    .row-label {
-        padding-top: 8px;
-        font-weight: 500;
-        text-align: right;
-    }
-    [data-testid="stNumberInput"] {
-        max-width: 120px;
-    }
-    [data-baseweb="select"] {
-        max-width: 100%;
-    }
-    [data-testid="stDateInput"] {
-        max-width: 150px;
-    }
-    [data-testid="stSlider"] {
-        padding-top: 8px;
-    }
-    .stNumberInput button:focus {
-        outline: none !important;
-        box-shadow: none !important;
-    }
-    .stNumberInput button:focus-visible {
-        outline: none !important;
-        box-shadow: none !important;
-    }
-    [data-baseweb="input"]:focus-within {
-        border-color: #ccc !important;
-        box-shadow: none !important;
-    }
-</style>
-""", unsafe_allow_html=True)
+st.markdown(_CSS, unsafe_allow_html=True)
 
 st.title("Hospitalist Compensation Calculator")
 st.markdown("**FY 27** (July 1, 2026 - June 30, 2027)")
@@ -287,155 +399,90 @@ col_input, col_results = st.columns([1, 1])
 with col_input:
     st.markdown("### Employment Status")
 
-    _, c1, c2, _ = st.columns([0.3, 1.2, 1, 0.3])
-    c1.markdown('<p class="row-label">Start Date</p>', unsafe_allow_html=True)
-    started_before_fy = c2.checkbox("On or before 7/1/26", value=True, label_visibility="visible")
-
-    if started_before_fy:
-        start_date = FISCAL_YEAR_START
-    else:
-        _, c1, c2, _ = st.columns([0.3, 1.2, 1, 0.3])
-        c1.markdown('<p class="row-label"></p>', unsafe_allow_html=True)
-        start_date = c2.date_input("Start Date", value=date(2026, 8, 1), min_value=date(2026, 7, 2), max_value=FISCAL_YEAR_END, format="MM/DD/YYYY", label_visibility="collapsed")
-
-    _, c1, c2, _ = st.columns([0.3, 1.2, 1, 0.3])
-    c1.markdown('<p class="row-label">Leave Days</p>', unsafe_allow_html=True)
-    leave_days = c2.number_input("Leave Days", min_value=0, max_value=365, value=0, label_visibility="collapsed")
-
-    st.markdown("### FTE Allocation")
+    # Kept outside the form so unticking it reveals the date picker right away
+    started_before_fy = labeled_row("Start Date").checkbox("On or before 7/1/26", value=True, label_visibility="visible")
 
-    _, c1, c2, _ = st.columns([0.3, 1.2, 1, 0.3])
-    c1.markdown('<p class="row-label">Status FTE</p>', unsafe_allow_html=True)
-    status_fte = c2.slider("Status FTE", min_value=0.0, max_value=1.0, value=1.0, step=0.05, label_visibility="collapsed")
+    # Remaining inputs are batched in a form so the page only recalculates on
+    # submit, not on every slider tick or keystroke
+    with st.form("inputs", clear_on_submit=False):
+        if started_before_fy:
+            start_date = FISCAL_YEAR_START
+        else:
+            start_date = labeled_row("").date_input("Start Date", value=date(2026, 8, 1), min_value=date(2026, 7, 2), max_value=FISCAL_YEAR_END, format="MM/DD/YYYY", label_visibility="collapsed")
 
-    _, c1, c2, _ = st.columns([0.3, 1.2, 1, 0.3])
-    c1.markdown('<p class="row-label">Non-Clinical FTE</p>', unsafe_allow_html=True)
-    non_clinical_fte = c2.slider("Non-Clinical FTE", min_value=0.0, max_value=1.0, value=0.0, step=0.01, label_visibility="collapsed")
+        leave_days = labeled_row("Leave Days").number_input("Leave Days", min_value=0, max_value=365, value=0, label_visibility="collapsed")
 
-    _, c1, c2, _ = st.columns([0.3, 1.2, 1, 0.3])
-    c1.markdown('<p class="row-label">Other Dept FTE</p>', unsafe_allow_html=True)
-    other_dept_fte = c2.slider("Other Dept FTE", min_value=0.0, max_value=1.0, value=0.0, step=0.01, label_visibility="collapsed")
+        st.markdown("### FTE Allocation")
 
-    st.markdown("### Rank & Experience")
+        status_fte = labeled_row("Status FTE").slider("Status FTE", min_value=0.0, max_value=1.0, value=1.0, step=0.05, label_visibility="collapsed")
 
-    _, c1, c2, _ = st.columns([0.3, 1.2, 1, 0.3])
-    c1.markdown('<p class="row-label">Academic Rank</p>', unsafe_allow_html=True)
-    academic_rank = c2.selectbox("Academic Rank", options=list(A_COMPONENT_BY_RANK.keys()), index=0, label_visibility="collapsed")
+        non_clinical_fte = labeled_row("Non-Clinical FTE").slider("Non-Clinical FTE", min_value=0.0, max_value=1.0, value=0.0, step=0.01, label_visibility="collapsed")
 
-    _, c1, c2, _ = st.columns([0.3, 1.2, 1, 0.3])
-    c1.markdown('<p class="row-label">Graduation Year</p>', unsafe_allow_html=True)
-    graduation_year = c2.number_input("Graduation Year", min_value=1980, max_value=2026, value=2026, label_visibility="collapsed")
+        other_dept_fte = labeled_row("Other Dept FTE").slider("Other Dept FTE", min_value=0.0, max_value=1.0, value=0.0, step=0.01, label_visibility="collapsed")
 
-    _, c1, c2, _ = st.columns([0.3, 1.2, 1, 0.3])
-    c1.markdown('<p class="row-label">Addiction Board Certified</p>', unsafe_allow_html=True)
-    addiction_board_certified = c2.checkbox("Addiction Board Certified", value=False, label_visibility="collapsed")
+        st.markdown("### Rank & Experience")
 
-    _, c1, c2, _ = st.columns([0.3, 1.2, 1, 0.3])
-    c1.markdown('<p class="row-label">Other Stipend ($)</p>', unsafe_allow_html=True)
-    stipend_input = c2.text_input("Other Stipend", value="0", label_visibility="collapsed")
-    try:
-        other_stipend = float(stipend_input.replace(",", "").replace("$", ""))
-    except ValueError:
-        other_stipend = 0
-
-    st.markdown("### Shift Mix (Calendar Days)")
-
-    with st.expander("Shift Type Reference"):
-        ref_text = """
-Shift Type                  Shift Eq   SoS Value   Notes
---------------------------  --------   ---------   ------------------
-Teaching                    1.0        1.0
-Direct Care Days            1.0        1.25        Standard day shifts
-Women & Families            1.2        1.25
-Standard Nights (first 21)  1.0        1.5         Night premium
-Premium Nights (after 21)   1.0        1.75        Extra night premium
-Episcopal                   0.75       1.05
-Clinic                      0.9        1.125       Outpatient
-Addiction                   1.0        --          Separate compensation
+        academic_rank = labeled_row("Academic Rank").selectbox("Academic Rank", options=list(A_COMPONENT_BY_RANK.keys()), index=0, label_visibility="collapsed")
 
-1.0 FTE = 183 shift equivalents/year
-Addiction/Other Dept: $240,000 per FTE
-Addiction Board Bonus: $20,000
-        """
-        st.code(ref_text, language=None)
+        graduation_year = labeled_row("Graduation Year").number_input("Graduation Year", min_value=1980, max_value=2026, value=2026, label_visibility="collapsed")
 
-    shift_days = {}
+        addiction_board_certified = labeled_row("Addiction Board Certified").checkbox("Addiction Board Certified", value=False, label_visibility="collapsed")
 
-    _, c1, c2, _ = st.columns([0.3, 1.2, 1, 0.3])
-    c1.markdown('<p class="row-label">Teaching</p>', unsafe_allow_html=True)
-    teaching_options = {f"{w} week{'s' if w != 1 else ''} ({w * 7} days)": w * 7 for w in range(0, 17)}
-    teaching_selection = c2.selectbox("Teaching", options=list(teaching_options.keys()), index=6, label_visibility="collapsed")
-    shift_days["Teaching"] = teaching_options[teaching_selection]
+        stipend_input = labeled_row("Other Stipend ($)").text_input("Other Stipend", value="0", label_visibility="collapsed")
+        try:
+            other_stipend = float(stipend_input.replace(",", "").replace("$", ""))
+        except ValueError:
+            other_stipend = 0
 
-    # Placeholder for Direct Care Days
-    direct_care_placeholder = st.empty()
+        st.markdown("### Shift Mix (Calendar Days)")
 
-    _, c1, c2, _ = st.columns([0.3, 1.2, 1, 0.3])
-    c1.markdown('<p class="row-label">Women & Families</p>', unsafe_allow_html=True)
-    shift_days["Women & Families Days"] = c2.number_input("W&F", min_value=0, max_value=365, value=0, label_visibility="collapsed")
+        with st.expander("Shift Type Reference"):
+            st.code(_SHIFT_REFERENCE, language=None)
 
-    _, c1, c2, _ = st.columns([0.3, 1.2, 1, 0.3])
-    c1.markdown('<p class="row-label">Nights</p>', unsafe_allow_html=True)
-    shift_days["Nights"] = c2.number_input("Nights", min_value=0, max_value=365, value=28, label_visibility="collapsed")
+        shift_days = {}
 
-    _, c1, c2, _ = st.columns([0.3, 1.2, 1, 0.3])
-    c1.markdown('<p class="row-label">Episcopal</p>', unsafe_allow_html=True)
-    shift_days["Episcopal"] = c2.number_input("Episcopal", min_value=0, max_value=365, value=0, label_visibility="collapsed")
+        teaching_selection = labeled_row("Teaching").selectbox("Teaching", options=_TEACHING_LABELS, index=6, label_visibility="collapsed")
+        shift_days["Teaching"] = _TEACHING_OPTIONS[teaching_selection]
 
-    _, c1, c2, _ = st.columns([0.3, 1.2, 1, 0.3])
-    c1.markdown('<p class="row-label">Clinic</p>', unsafe_allow_html=True)
-    clinic_options = {f"{w} week{'s' if w != 1 else ''} ({w * 5} days)": w * 5 for w in range(0, 53)}
-    clinic_selection = c2.selectbox("Clinic", options=list(clinic_options.keys()), index=0, label_visibility="collapsed")
-    shift_days["Clinic"] = clinic_options[clinic_selection]
+        # Placeholder for Direct Care Days
+        direct_care_placeholder = st.empty()
 
-    _, c1, c2, _ = st.columns([0.3, 1.2, 1, 0.3])
-    c1.markdown('<p class="row-label">Addiction Medicine</p>', unsafe_allow_html=True)
-    shift_days["Addiction"] = c2.number_input("Addiction", min_value=0, max_value=365, value=0, label_visibility="collapsed")
+        shift_days["Women & Families Days"] = labeled_row("Women & Families").number_input("W&F", min_value=0, max_value=365, value=0, label_visibility="collapsed")
 
-    # Calculate Addiction FTE for display
-    addiction_fte_calc = shift_days["Addiction"] / BASE_SHIFT_EQUIVALENTS
+        shift_days["Nights"] = labeled_row("Nights").number_input("Nights", min_value=0, max_value=365, value=28, label_visibility="collapsed")
 
-    # Calculate time fraction for UI (same logic as in calculate_compensation)
-    if start_date <= FISCAL_YEAR_START:
-        ui_days_in_fy = TOTAL_FY_DAYS
-    elif start_date > FISCAL_YEAR_END:
-        ui_days_in_fy = 0
-    else:
-        ui_days_in_fy = (FISCAL_YEAR_END - start_date).days + 1
-    ui_effective_days = max(0, ui_days_in_fy - leave_days)
-    ui_time_fraction = ui_effective_days / TOTAL_FY_DAYS
+        shift_days["Episcopal"] = labeled_row("Episcopal").number_input("Episcopal", min_value=0, max_value=365, value=0, label_visibility="collapsed")
 
-    # Calculate Direct Care Days (prorated by time fraction)
-    actual_hm_fte = max(0, status_fte - non_clinical_fte - other_dept_fte - addiction_fte_calc)
-    target_shift_eq = int(actual_hm_fte * BASE_SHIFT_EQUIVALENTS * ui_time_fraction + 0.5)
+        clinic_selection = labeled_row("Clinic").selectbox("Clinic", options=_CLINIC_LABELS, index=0, label_visibility="collapsed")
+        shift_days["Clinic"] = _CLINIC_OPTIONS[clinic_selection]
 
-    other_shifts = (
-        shift_days["Teaching"] * SHIFT_TYPES["Teaching"]["ratio"] +
-        shift_days["Women & Families Days"] * SHIFT_TYPES["Women & Families Days"]["ratio"] +
-        shift_days["Nights"] +
-        shift_days["Episcopal"] * SHIFT_TYPES["Episcopal"]["ratio"] +
-        shift_days["Clinic"] * SHIFT_TYPES["Clinic"]["ratio"]
-    )
-    direct_care_days = max(0, int(target_shift_eq - other_shifts))
-    shift_days["Direct Care Days"] = direct_care_days
+        shift_days["Addiction"] = labeled_row("Addiction Medicine").number_input("Addiction", min_value=0, max_value=365, value=0, label_visibility="collapsed")
 
-    with direct_care_placeholder.container():
-        _, c1, c2, _ = st.columns([0.3, 1.2, 1, 0.3])
-        c1.markdown('<p class="row-label">Direct Care Days</p>', unsafe_allow_html=True)
-        c2.markdown(f"**{direct_care_days}** *(auto)*")
+        # Placeholder for the over-capacity warning
+        capacity_placeholder = st.empty()
 
-    # Validation warning if shifts exceed FTE capacity
-    total_entered_shifts = other_shifts + shift_days.get("Addiction", 0)
-    if other_shifts > target_shift_eq:
-        excess_shifts = int(other_shifts - target_shift_eq + 0.5)
-        st.warning(f"⚠️ Shifts exceed FTE capacity by {excess_shifts} shift equivalents. Reduce shifts or increase Hospitalist FTE.")
+        submitted = st.form_submit_button("Calculate", type="primary")
 
 # =============================================================================
 # RESULTS
 # =============================================================================
 
-with col_results:
-    result = calculate_compensation(
+# Snapshot the submitted inputs (the defaults on first load). The Direct Care
+# preview, the capacity warning and the results all read from this snapshot,
+# so reruns that did not submit the form (e.g. toggling the start-date
+# checkbox) cannot leave the screen showing two different sets of inputs.
+if submitted or "result" not in st.session_state:
+    # Calculate Direct Care Days (prorated by time fraction)
+    shift_plan = _derive_shift_plan(
+        _time_fraction(start_date, leave_days),
+        status_fte,
+        non_clinical_fte,
+        other_dept_fte,
+        shift_days,
+    )
+    shift_days["Direct Care Days"] = shift_plan.direct_care_days
+
+    st.session_state["result"] = calculate_compensation(
         start_date=start_date,
         leave_days=leave_days,
         status_fte=status_fte,
@@ -447,7 +494,27 @@ with col_results:
         addiction_board_certified=addiction_board_certified,
         other_stipend=other_stipend,
     )
+    st.session_state["shown_inputs"] = {
+        "status_fte": status_fte,
+        "other_dept_fte": other_dept_fte,
+        "academic_rank": academic_rank,
+        "shift_days": dict(shift_days),
+        "shift_plan": shift_plan,
+    }
+
+result = st.session_state["result"]
+shown = st.session_state["shown_inputs"]
+shown_plan = shown["shift_plan"]
 
+with direct_care_placeholder.container():
+    labeled_row("Direct Care Days").markdown(f"**{shown_plan.direct_care_days}** *(auto)*")
+
+# Validation warning if shifts exceed FTE capacity
+if shown_plan.other_shifts > shown_plan.target_shift_eq:
+    excess_shifts = int(shown_plan.other_shifts - shown_plan.target_shift_eq + 0.5)
+    capacity_placeholder.warning(f"⚠️ Shifts exceed FTE capacity by {excess_shifts} shift equivalents. Reduce shifts or increase Hospitalist FTE.")
+
+with col_results:
     left_col, right_col = st.columns([1, 1])
 
     with left_col:
@@ -470,13 +537,13 @@ with col_results:
 
     with right_col:
         st.markdown("### FTE Summary")
-        total_calendar_days = sum(v for k, v in shift_days.items() if k != "Addiction") + shift_days.get("Addiction", 0)
-        other_dept_fte_total = result.addiction_fte + other_dept_fte
+        total_calendar_days = sum(shown["shift_days"].values())
+        other_dept_fte_total = result.addiction_fte + shown["other_dept_fte"]
         time_pct = f"{result.time_fraction * 100:.0f}%" if result.time_fraction < 1.0 else "100%"
         st.markdown(f"""
 | Metric | Value |
 |--------|-------|
-| Status FTE | {status_fte:.2f} |
+| Status FTE | {shown['status_fte']:.2f} |
 | Time Fraction | {time_pct} |
 | Hospitalist FTE | {result.hospitalist_fte:.2f} |
 | Other Dept FTE | {other_dept_fte_total:.2f} |
@@ -489,7 +556,7 @@ with col_results:
 
     st.markdown("### A Component (Base Salary)")
     st.markdown(f"""
-- **Rank:** {academic_rank}
+- **Rank:** {shown['academic_rank']}
 - **Base A:** ${result.a_component:,}
 - **FTE Adjusted:** ${result.a_fte_adjusted:,.0f}
     """)
@@ -499,15 +566,16 @@ with col_results:
     st.markdown("### B Component (Strength of Schedule)")
 
     if result.shift_breakdown:
-        breakdown_md = "| Shift Type | Days | Shift Eq | SoS Value |\n|------------|------|----------|----------|\n"
-        total_days = 0
-        total_shift_eq = 0
-        for shift_type, data in result.shift_breakdown.items():
-            if data["days"] > 0:
-                breakdown_md += f"| {shift_type} | {data['days']} | {int(data['shift_eq'] + 0.5)} | {data['sos_value']:.2f} |\n"
-                total_days += data["days"]
-                total_shift_eq += data["shift_eq"]
-        breakdown_md += f"| **Total** | **{total_days}** | **{int(total_shift_eq + 0.5)}** | **{result.total_sos_value:.2f}** |"
+        header = "| Shift Type | Days | Shift Eq | SoS Value |\n|------------|------|----------|----------|\n"
+        worked = [(shift_type, data) for shift_type, data in result.shift_breakdown.items() if data["days"] > 0]
+        rows = [
+            f"| {shift_type} | {data['days']} | {int(data['shift_eq'] + 0.5)} | {data['sos_value']:.2f} |"
+            for shift_type, data in worked
+        ]
+        total_days = sum(data["days"] for _, data in worked)
+        total_shift_eq = sum(data["shift_eq"] for _, data in worked)
+        totals_row = f"| **Total** | **{total_days}** | **{int(total_shift_eq + 0.5)}** | **{result.total_sos_value:.2f}** |"
+        breakdown_md = header + "\n".join(rows + [totals_row])
         st.markdown(breakdown_md)
 
     st.markdown(f"""
@@ -523,7 +591,7 @@ with col_results:
         st.markdown("### Other Compensation")
         if result.addiction_fte > 0:
             st.markdown(f"- **Addiction FTE:** {result.addiction_fte:.2f} × $240,000 = ${result.addiction_fte * OTHER_DEPT_RATE:,.0f}")
-        if other_dept_fte > 0:
-            st.markdown(f"- **Other Dept FTE:** {other_dept_fte:.2f} × $240,000 = ${other_dept_fte * OTHER_DEPT_RATE:,.0f}")
+        if shown["other_dept_fte"] > 0:
+            st.markdown(f"- **Other Dept FTE:** {shown['other_dept_fte']:.2f} × $240,000 = ${shown['other_dept_fte'] * OTHER_DEPT_RATE:,.0f}")
         if result.addiction_board_bonus > 0:
             st.markdown(f"- **Addiction Board Bonus:** ${result.addiction_board_bonus:,.0f}")